@@ -20,12 +20,20 @@ class Dot2DotActivity {
         this.currentBrushSize = 15; // Medium by default
         this.lastX = 0;
         this.lastY = 0;
+        this._canvasRect = null; // Cached for the duration of a stroke
+        this._pendingPoints = []; // Pointer samples waiting for the next frame
+        this._strokeFrame = null;
         this.backgroundImage = null;
+        this._backdrop = null; // White page + scaled image, reused until either changes
+        this._backdropImage = null;
         this._resizeHandler = () => this.resizeCanvas();
         this._firstLoad = true;
         this._lastEncouragementTime = 0;
         this._encouragementInterval = null;
         this._recentlyDrawn = false;
+        this.palettePage = 0;
+        this.totalPalettePages = 0;
+        this.keyPressHandler = null;
     }
 
     async start() {
@@ -38,7 +46,11 @@ class Dot2DotActivity {
             return;
         }
 
-        this.ctx = this.canvas.getContext('2d');
+        // The page is always painted white, so an opaque context lets the
+        // browser skip alpha blending when compositing the canvas
+        this.ctx = this.canvas.getContext('2d', { alpha: false });
+        this.ctx.fillStyle = 'white';
+        this.ctx.fillRect(0, 0, this.canvas.width, this.canvas.height);
 
         // Set canvas size to be responsive
         this.resizeCanvas();
@@ -86,6 +98,10 @@ class Dot2DotActivity {
         this.canvas.width = maxWidth;
         this.canvas.height = maxHeight;
 
+        // Opaque canvases reset to black, so paint the new area white first
+        this.ctx.fillStyle = 'white';
+        this.ctx.fillRect(0, 0, this.canvas.width, this.canvas.height);
+
         // Restore content if it existed
         if (imageData) {
             this.ctx.putImageData(imageData, 0, 0);
@@ -107,21 +123,19 @@ class Dot2DotActivity {
             title.textContent = `Dot to Dot: ${imageName}`;
         }
 
-        // Load image
-        await new Promise((resolve, reject) => {
-            const img = new Image();
-            img.onload = () => {
-                this.backgroundImage = img;
-                this.drawBackgroundImage();
-                this.updateCounter();
-                resolve();
-            };
-            img.onerror = () => {
-                console.error(`Failed to load image: ${imagePath}`);
-                reject();
-            };
-            img.src = imagePath;
-        });
+        // Load and decode off the main thread, so the first drawImage
+        // doesn't stall on a synchronous PNG decode
+        const img = new Image();
+        img.src = imagePath;
+        try {
+            await img.decode();
+        } catch (error) {
+            console.error(`Failed to load image: ${imagePath}`);
+            throw error;
+        }
+        this.backgroundImage = img;
+        this.drawBackgroundImage();
+        this.updateCounter();
 
         // Speak image change (skip first load — welcome handles it)
         if (!this._firstLoad) {
@@ -134,25 +148,49 @@ class Dot2DotActivity {
     drawBackgroundImage() {
         if (!this.backgroundImage || !this.ctx) return;
 
-        // Clear canvas
-        this.ctx.fillStyle = 'white';
-        this.ctx.fillRect(0, 0, this.canvas.width, this.canvas.height);
+        this.ctx.drawImage(this.getBackdrop(), 0, 0);
+    }
+
+    /**
+     * Returns the white page with the current image scaled to fit. It is
+     * rendered once per image and canvas size, so clearing or redrawing
+     * the page is a single copy rather than a fill plus a resample.
+     */
+    getBackdrop() {
+        const width = this.canvas.width;
+        const height = this.canvas.height;
+        if (this._backdrop && this._backdropImage === this.backgroundImage &&
+            this._backdrop.width === width && this._backdrop.height === height) {
+            return this._backdrop;
+        }
+
+        const backdrop = this._backdrop || document.createElement('canvas');
+        backdrop.width = width;
+        backdrop.height = height;
+        const ctx = backdrop.getContext('2d', { alpha: false });
+
+        ctx.fillStyle = 'white';
+        ctx.fillRect(0, 0, width, height);
 
         // Calculate scaling to fit image within canvas while maintaining aspect ratio
         const scale = Math.min(
-            this.canvas.width / this.backgroundImage.width,
-            this.canvas.height / this.backgroundImage.height
+            width / this.backgroundImage.width,
+            height / this.backgroundImage.height
         );
 
-        const x = (this.canvas.width - this.backgroundImage.width * scale) / 2;
-        const y = (this.canvas.height - this.backgroundImage.height * scale) / 2;
+        const x = (width - this.backgroundImage.width * scale) / 2;
+        const y = (height - this.backgroundImage.height * scale) / 2;
 
-        this.ctx.drawImage(
+        ctx.drawImage(
             this.backgroundImage,
             x, y,
             this.backgroundImage.width * scale,
             this.backgroundImage.height * scale
         );
+
+        this._backdrop = backdrop;
+        this._backdropImage = this.backgroundImage;
+        return backdrop;
     }
 
     setupColorPalette() {
@@ -176,18 +214,12 @@ class Dot2DotActivity {
         const palette = document.getElementById('colorPalette');
         if (!palette) return;
 
-        const start = this.palettePage * ActivityManager.PALETTE_PAGE_SIZE;
-        const colors = ActivityManager.PALETTE_COLORS.slice(start, start + ActivityManager.PALETTE_PAGE_SIZE);
-
-        palette.innerHTML = colors.map(c => {
-            const border = c.border ? ' border-color: #dee2e6;' : '';
-            const active = c.hex === this.currentColor ? ' active' : '';
-            return `<div class="color-btn${active}" data-color="${c.hex}" style="background: ${c.hex};${border}" title="${c.name}"></div>`;
-        }).join('');
+        palette.innerHTML = ActivityManager.getPalettePageHTML(this.palettePage);
+        palette.querySelector(`.color-btn[data-color="${this.currentColor}"]`)?.classList.add('active');
 
         palette.querySelectorAll('.color-btn').forEach(btn => {
             btn.addEventListener('click', () => {
-                document.querySelectorAll('.color-btn').forEach(b => b.classList.remove('active'));
+                palette.querySelector('.color-btn.active')?.classList.remove('active');
                 btn.classList.add('active');
                 this.currentColor = btn.dataset.color;
             });
@@ -312,68 +344,83 @@ class Dot2DotActivity {
         this.canvas.addEventListener('mouseup', () => this.stopDrawing());
         this.canvas.addEventListener('mouseout', () => this.stopDrawing());
 
-        // Touch events for mobile/tablets
+        // Touch events for mobile/tablets — a Touch carries clientX/clientY, so pass
+        // it straight through rather than allocating a synthetic MouseEvent per move
         this.canvas.addEventListener('touchstart', (e) => {
             e.preventDefault();
-            const touch = e.touches[0];
-            const mouseEvent = new MouseEvent('mousedown', {
-                clientX: touch.clientX,
-                clientY: touch.clientY
-            });
-            this.canvas.dispatchEvent(mouseEvent);
+            this.startDrawing(e.touches[0]);
         });
 
         this.canvas.addEventListener('touchmove', (e) => {
             e.preventDefault();
-            const touch = e.touches[0];
-            const mouseEvent = new MouseEvent('mousemove', {
-                clientX: touch.clientX,
-                clientY: touch.clientY
-            });
-            this.canvas.dispatchEvent(mouseEvent);
+            this.draw(e.touches[0]);
         });
 
         this.canvas.addEventListener('touchend', (e) => {
             e.preventDefault();
-            const mouseEvent = new MouseEvent('mouseup', {});
-            this.canvas.dispatchEvent(mouseEvent);
+            this.stopDrawing();
         });
     }
 
     startDrawing(e) {
         this.isDrawing = true;
-        const rect = this.canvas.getBoundingClientRect();
-        this.lastX = e.clientX - rect.left;
-        this.lastY = e.clientY - rect.top;
+        // Measure once per stroke; getBoundingClientRect() forces layout
+        this._canvasRect = this.canvas.getBoundingClientRect();
+        this.lastX = e.clientX - this._canvasRect.left;
+        this.lastY = e.clientY - this._canvasRect.top;
+
+        // Colour and size can't change mid-stroke, so apply them once here
+        this.ctx.strokeStyle = this.currentColor;
+        this.ctx.lineWidth = this.currentBrushSize;
+        this.ctx.lineCap = 'round';
+        this.ctx.lineJoin = 'round';
     }
 
     draw(e) {
         if (!this.isDrawing) return;
 
-        const rect = this.canvas.getBoundingClientRect();
-        const currentX = e.clientX - rect.left;
-        const currentY = e.clientY - rect.top;
+        const rect = this._canvasRect;
+        this._pendingPoints.push(e.clientX - rect.left, e.clientY - rect.top);
+        if (this._strokeFrame === null) {
+            this._strokeFrame = requestAnimationFrame(() => this.flushStroke());
+        }
+        this._recentlyDrawn = true;
+    }
+
+    /**
+     * Draws every pointer sample gathered since the last frame as one path.
+     */
+    flushStroke() {
+        if (this._strokeFrame !== null) {
+            cancelAnimationFrame(this._strokeFrame);
+            this._strokeFrame = null;
+        }
+        const points = this._pendingPoints;
+        if (points.length === 0) return;
 
         this.ctx.beginPath();
         this.ctx.moveTo(this.lastX, this.lastY);
-        this.ctx.lineTo(currentX, currentY);
-        this.ctx.strokeStyle = this.currentColor;
-        this.ctx.lineWidth = this.currentBrushSize;
-        this.ctx.lineCap = 'round';
-        this.ctx.lineJoin = 'round';
+        for (let i = 0; i < points.length; i += 2) {
+            this.ctx.lineTo(points[i], points[i + 1]);
+        }
         this.ctx.stroke();
 
-        this.lastX = currentX;
-        this.lastY = currentY;
-        this._recentlyDrawn = true;
+        this.lastX = points[points.length - 2];
+        this.lastY = points[points.length - 1];
+        points.length = 0;
     }
 
     stopDrawing() {
+        this.flushStroke();
         this.isDrawing = false;
     }
 
     stop() {
         console.log('Stopping Dot to Dot activity');
+        if (this._strokeFrame !== null) {
+            cancelAnimationFrame(this._strokeFrame);
+            this._strokeFrame = null;
+        }
         if (this.keyPressHandler) {
             document.removeEventListener('keydown', this.keyPressHandler);
         }
@@ -4,6 +4,31 @@
  */
 
 class JigsawActivity {
+    // Unit direction vectors for the fixed-angle scene details, computed once
+    static SUN_RAY_DIRS = Array.from({ length: 8 }, (_, i) => {
+        const angle = (i / 8) * Math.PI * 2;
+        return [Math.cos(angle), Math.sin(angle)];
+    });
+
+    static PETAL_DIRS = Array.from({ length: 5 }, (_, i) => {
+        const angle = (i / 5) * Math.PI * 2;
+        return [Math.cos(angle), Math.sin(angle)];
+    });
+
+    // Unit five-point star, visiting every second point so it draws as a pentagram
+    static STAR5_POINTS = Array.from({ length: 5 }, (_, i) => {
+        const angle = (i * 4 * Math.PI) / 5 - Math.PI / 2;
+        return [Math.cos(angle), Math.sin(angle)];
+    });
+
+    // Side length of the square puzzle board and of every rendered scene
+    static BOARD_SIZE = 400;
+
+    // Rendered pixels are shared by every instance, so restarting the activity
+    // reuses them instead of re-rasterizing the scenes
+    static _sceneCache = new Map(); // scene index -> BOARD_SIZE scene canvas
+    static _gridOverlays = new Map(); // difficulty -> grid + border canvas
+
     constructor() {
         this.scenes = [
             { name: 'Sunny House', draw: (ctx, w, h) => this.drawSunnyHouse(ctx, w, h) },
@@ -27,6 +52,7 @@ class JigsawActivity {
         this.difficulty = 'easy';
         this.currentSceneIndex = 0;
         this.selectedPiece = null;
+        this._selectedWrapper = null;
         this.placedCount = 0;
         this.totalPieces = 0;
         this.processing = false;
@@ -34,6 +60,8 @@ class JigsawActivity {
 
         // Scene canvas (full image)
         this.sceneCanvas = null;
+        this._prewarmHandle = null;
+        this._dragGhost = null;
         this.boardCanvas = null;
         this.boardCtx = null;
         this.pieceSize = 0;
@@ -44,7 +72,7 @@ class JigsawActivity {
         console.log('Starting Jigsaw Puzzle activity');
 
         if (typeof RewardsManager !== 'undefined') {
-            this.rewards = new RewardsManager();
+            this.rewards = window.rewardsManager || new RewardsManager();
             await this.rewards.loadProgress();
             this.rewards.renderProgressPanel('jigsawProgressDisplay', 'jigsaw');
         }
@@ -57,6 +85,25 @@ class JigsawActivity {
         }
 
         this.startNewPuzzle();
+        this.prewarmScenes();
+    }
+
+    /**
+     * Render the remaining scenes into the cache one at a time while the
+     * browser is idle, so switching scenes doesn't stall on first visit.
+     */
+    prewarmScenes() {
+        const schedule = window.requestIdleCallback || ((cb) => setTimeout(cb, 50));
+        const pending = this.scenes.map((_, i) => i).filter(i => !JigsawActivity._sceneCache.has(i));
+
+        const step = () => {
+            this._prewarmHandle = null;
+            const index = pending.shift();
+            if (index === undefined) return;
+            this.getSceneCanvas(index);
+            this._prewarmHandle = schedule(step);
+        };
+        this._prewarmHandle = schedule(step);
     }
 
     setupDifficultyButtons() {
@@ -107,13 +154,9 @@ class JigsawActivity {
             title.textContent = `Jigsaw: ${scene.name}`;
         }
 
-        // Generate scene image on an offscreen canvas
-        const boardSize = 400;
-        this.sceneCanvas = document.createElement('canvas');
-        this.sceneCanvas.width = boardSize;
-        this.sceneCanvas.height = boardSize;
-        const sceneCtx = this.sceneCanvas.getContext('2d');
-        scene.draw(sceneCtx, boardSize, boardSize);
+        // Scene image (rendered once per scene, then reused)
+        const boardSize = JigsawActivity.BOARD_SIZE;
+        this.sceneCanvas = this.getSceneCanvas(this.currentSceneIndex % this.scenes.length);
 
         this.pieceSize = boardSize / Math.max(config.cols, config.rows);
 
@@ -136,6 +179,25 @@ class JigsawActivity {
         AppAPI.call('speak', startText);
     }
 
+    /**
+     * Returns the BOARD_SIZE offscreen canvas for a scene, drawing it on first use.
+     * Scenes are built from hundreds of canvas primitives, so changing
+     * difficulty or revisiting a scene reuses the cached pixels instead.
+     */
+    getSceneCanvas(index) {
+        let canvas = JigsawActivity._sceneCache.get(index);
+        if (!canvas) {
+            const size = JigsawActivity.BOARD_SIZE;
+            canvas = document.createElement('canvas');
+            canvas.width = size;
+            canvas.height = size;
+            // Every scene paints its full background, so the canvas can be opaque
+            this.scenes[index].draw(canvas.getContext('2d', { alpha: false }), size, size);
+            JigsawActivity._sceneCache.set(index, canvas);
+        }
+        return canvas;
+    }
+
     drawBoard() {
         const ctx = this.boardCtx;
         const config = this.difficulties[this.difficulty];
@@ -150,20 +212,53 @@ class JigsawActivity {
         ctx.globalAlpha = 1.0;
 
         // Draw placed pieces at full opacity
+        const cols = config.cols;
+        const pw = w / cols;
+        const ph = h / config.rows;
+        const scene = this.sceneCanvas;
+        const gridState = this.gridState;
         for (let i = 0; i < this.totalPieces; i++) {
-            if (this.gridState[i]) {
-                const col = i % config.cols;
-                const row = Math.floor(i / config.cols);
-                const pw = w / config.cols;
-                const ph = h / config.rows;
-                ctx.drawImage(
-                    this.sceneCanvas,
-                    col * pw, row * ph, pw, ph,
-                    col * pw, row * ph, pw, ph
-                );
+            if (gridState[i]) {
+                const x = (i % cols) * pw;
+                const y = Math.floor(i / cols) * ph;
+                ctx.drawImage(scene, x, y, pw, ph, x, y, pw, ph);
             }
         }
 
+        // Grid lines and border on top
+        ctx.drawImage(this.getGridOverlay(config, w, h), 0, 0);
+    }
+
+    /**
+     * Paints a newly placed piece into its cell without redrawing the
+     * rest of the board.
+     */
+    drawPlacedCell(index, config) {
+        const ctx = this.boardCtx;
+        const w = this.boardCanvas.width;
+        const h = this.boardCanvas.height;
+        const pw = w / config.cols;
+        const ph = h / config.rows;
+        const x = (index % config.cols) * pw;
+        const y = Math.floor(index / config.cols) * ph;
+
+        ctx.drawImage(this.sceneCanvas, x, y, pw, ph, x, y, pw, ph);
+        ctx.drawImage(this.getGridOverlay(config, w, h), x, y, pw, ph, x, y, pw, ph);
+    }
+
+    /**
+     * Returns the dashed grid and border for a difficulty, drawn once onto a
+     * transparent canvas so each board redraw composites it with one call.
+     */
+    getGridOverlay(config, w, h) {
+        let overlay = JigsawActivity._gridOverlays.get(this.difficulty);
+        if (overlay && overlay.width === w && overlay.height === h) return overlay;
+
+        overlay = document.createElement('canvas');
+        overlay.width = w;
+        overlay.height = h;
+        const ctx = overlay.getContext('2d');
+
         // Dashed grid lines
         ctx.strokeStyle = 'rgba(255, 255, 255, 0.5)';
         ctx.lineWidth = 2;
@@ -172,18 +267,16 @@ class JigsawActivity {
         const pw = w / config.cols;
         const ph = h / config.rows;
 
+        ctx.beginPath();
         for (let c = 1; c < config.cols; c++) {
-            ctx.beginPath();
             ctx.moveTo(c * pw, 0);
             ctx.lineTo(c * pw, h);
-            ctx.stroke();
         }
         for (let r = 1; r < config.rows; r++) {
-            ctx.beginPath();
             ctx.moveTo(0, r * ph);
             ctx.lineTo(w, r * ph);
-            ctx.stroke();
         }
+        ctx.stroke();
 
         ctx.setLineDash([]);
 
@@ -191,6 +284,9 @@ class JigsawActivity {
         ctx.strokeStyle = 'rgba(255, 255, 255, 0.3)';
         ctx.lineWidth = 3;
         ctx.strokeRect(1, 1, w - 2, h - 2);
+
+        JigsawActivity._gridOverlays.set(this.difficulty, overlay);
+        return overlay;
     }
 
     renderPieces(config) {
@@ -208,21 +304,28 @@ class JigsawActivity {
         for (let i = 0; i < this.totalPieces; i++) indices.push(i);
         indices.sort(() => Math.random() - 0.5);
 
+        // Build every piece off-document and insert them in one go
+        const fragment = document.createDocumentFragment();
+
+        // Every piece shares one display size — scale down for higher piece counts
+        const maxDisplay = this.totalPieces <= 9 ? 80 : this.totalPieces <= 16 ? 60 : 50;
+        const displaySize = Math.min(maxDisplay, pw);
+        const cols = config.cols;
+        const scene = this.sceneCanvas;
+
         indices.forEach(i => {
-            const col = i % config.cols;
-            const row = Math.floor(i / config.cols);
+            const col = i % cols;
+            const row = Math.floor(i / cols);
 
-            // Create mini canvas for this piece — scale down for higher piece counts
+            // Create mini canvas for this piece
             const pieceCanvas = document.createElement('canvas');
-            const maxDisplay = this.totalPieces <= 9 ? 80 : this.totalPieces <= 16 ? 60 : 50;
-            const displaySize = Math.min(maxDisplay, pw);
             pieceCanvas.width = displaySize;
             pieceCanvas.height = displaySize;
-            const pCtx = pieceCanvas.getContext('2d');
+            const pCtx = pieceCanvas.getContext('2d', { alpha: false });
 
             // Draw the piece from the scene
             pCtx.drawImage(
-                this.sceneCanvas,
+                scene,
                 col * pw, row * ph, pw, ph,
                 0, 0, displaySize, displaySize
             );
@@ -246,8 +349,10 @@ class JigsawActivity {
             // Drag support (touch)
             wrapper.addEventListener('touchstart', (e) => this.startDrag(e, wrapper, i), { passive: false });
 
-            tray.appendChild(wrapper);
+            fragment.appendChild(wrapper);
         });
+
+        tray.appendChild(fragment);
     }
 
     // =============================================
@@ -263,22 +368,16 @@ class JigsawActivity {
         const startX = isTouch ? e.touches[0].clientX : e.clientX;
         const startY = isTouch ? e.touches[0].clientY : e.clientY;
 
-        // Create a floating clone for drag visual
+        // Floating preview for the drag visual
         const rect = wrapper.getBoundingClientRect();
-        const ghost = wrapper.cloneNode(true);
-        ghost.className = 'jigsaw-piece-ghost';
-        ghost.style.cssText = `
-            position: fixed;
-            z-index: 9999;
-            pointer-events: none;
-            width: ${rect.width}px;
-            height: ${rect.height}px;
-            opacity: 0.85;
-            transform: scale(1.15);
-            transition: none;
-        `;
-        ghost.style.left = (startX - rect.width / 2) + 'px';
-        ghost.style.top = (startY - rect.height / 2) + 'px';
+        const ghost = this.getDragGhost(wrapper, rect);
+        // Positioned with a transform so moves don't touch layout
+        const halfW = rect.width / 2;
+        const halfH = rect.height / 2;
+        const moveGhost = (x, y) => {
+            ghost.style.transform = `translate(${x - halfW}px, ${y - halfH}px) scale(1.15)`;
+        };
+        moveGhost(startX, startY);
         document.body.appendChild(ghost);
 
         wrapper.classList.add('dragging');
@@ -287,8 +386,7 @@ class JigsawActivity {
         const onMove = (ev) => {
             const cx = isTouch ? ev.touches[0].clientX : ev.clientX;
             const cy = isTouch ? ev.touches[0].clientY : ev.clientY;
-            ghost.style.left = (cx - rect.width / 2) + 'px';
-            ghost.style.top = (cy - rect.height / 2) + 'px';
+            moveGhost(cx, cy);
             if (Math.abs(cx - startX) > 5 || Math.abs(cy - startY) > 5) moved = true;
         };
 
@@ -311,16 +409,47 @@ class JigsawActivity {
         document.addEventListener(isTouch ? 'touchend' : 'mouseup', onEnd);
     }
 
+    /**
+     * Returns the drag preview element, created once and reused for every drag.
+     * The piece pixels are copied in each time since cloneNode() leaves canvases blank.
+     */
+    getDragGhost(wrapper, rect) {
+        if (!this._dragGhost) {
+            this._dragGhost = document.createElement('div');
+            this._dragGhost.className = 'jigsaw-piece-ghost';
+            this._dragGhost.style.cssText = `
+                position: fixed;
+                z-index: 9999;
+                pointer-events: none;
+                left: 0;
+                top: 0;
+                opacity: 0.85;
+                transition: none;
+            `;
+            this._dragGhost.appendChild(document.createElement('canvas'));
+        }
+
+        const ghost = this._dragGhost;
+        const source = wrapper.querySelector('canvas');
+        const canvas = ghost.firstChild;
+        canvas.width = source.width;
+        canvas.height = source.height;
+        canvas.getContext('2d').drawImage(source, 0, 0);
+
+        ghost.style.width = `${rect.width}px`;
+        ghost.style.height = `${rect.height}px`;
+        return ghost;
+    }
+
     selectPiece(wrapper, pieceIndex) {
         if (this.processing) return;
         if (this.gridState[pieceIndex]) return;
 
         // Deselect previous
-        document.querySelectorAll('.jigsaw-piece-wrapper.selected').forEach(el => {
-            el.classList.remove('selected');
-        });
+        if (this._selectedWrapper) this._selectedWrapper.classList.remove('selected');
 
         this.selectedPiece = pieceIndex;
+        this._selectedWrapper = wrapper;
         wrapper.classList.add('selected');
     }
 
@@ -373,7 +502,7 @@ class JigsawActivity {
             if (wrapper) wrapper.classList.add('placed');
 
             this.selectedPiece = null;
-            this.drawBoard();
+            this.drawPlacedCell(targetIndex, config);
 
             if (window.characterManager) {
                 window.characterManager.playAnimation('happy', false);
@@ -400,13 +529,20 @@ class JigsawActivity {
             const wrongText = window.DinoPhrase ? window.DinoPhrase('jigsaw', 'wrong_spot') : 'Try another spot!';
             AppAPI.call('speak', wrongText);
 
-            // Flash the board cell red briefly
+            // Flash the board cell red briefly, then restore just that cell
             const ctx = this.boardCtx;
             const pw2 = this.boardCanvas.width / config.cols;
             const ph2 = this.boardCanvas.height / config.rows;
+            const x = Math.floor(col * pw2);
+            const y = Math.floor(row * ph2);
+            const saved = ctx.getImageData(x, y, Math.ceil((col + 1) * pw2) - x, Math.ceil((row + 1) * ph2) - y);
+            const gridState = this.gridState;
             ctx.fillStyle = 'rgba(239, 68, 68, 0.3)';
             ctx.fillRect(col * pw2, row * ph2, pw2, ph2);
-            setTimeout(() => this.drawBoard(), 400);
+            setTimeout(() => {
+                // A new puzzle may have redrawn the board in the meantime
+                if (this.gridState === gridState) ctx.putImageData(saved, x, y);
+            }, 400);
 
             this.selectedPiece = null;
             setTimeout(() => { this.processing = false; }, 500);
@@ -503,13 +639,12 @@ class JigsawActivity {
         // Sun rays
         ctx.strokeStyle = '#FFA000';
         ctx.lineWidth = 3;
-        for (let i = 0; i < 8; i++) {
-            const angle = (i / 8) * Math.PI * 2;
-            ctx.beginPath();
-            ctx.moveTo(w * 0.85 + Math.cos(angle) * 45, h * 0.15 + Math.sin(angle) * 45);
-            ctx.lineTo(w * 0.85 + Math.cos(angle) * 60, h * 0.15 + Math.sin(angle) * 60);
-            ctx.stroke();
+        ctx.beginPath();
+        for (const [dx, dy] of JigsawActivity.SUN_RAY_DIRS) {
+            ctx.moveTo(w * 0.85 + dx * 45, h * 0.15 + dy * 45);
+            ctx.lineTo(w * 0.85 + dx * 60, h * 0.15 + dy * 60);
         }
+        ctx.stroke();
 
         // House body
         ctx.fillStyle = '#E53935';
@@ -666,9 +801,9 @@ class JigsawActivity {
     }
 
     drawFarm(ctx, w, h) {
-        // Sky
+        // Sky (runs down behind the hills so no gap is left under their curve)
         ctx.fillStyle = '#87CEEB';
-        ctx.fillRect(0, 0, w, h * 0.5);
+        ctx.fillRect(0, 0, w, h * 0.6);
 
         // Hills
         ctx.fillStyle = '#81C784';
@@ -921,12 +1056,15 @@ class JigsawActivity {
         ctx.fillRect(x - 1.5, y, 3, size * 2);
         // Petals
         ctx.fillStyle = color;
-        for (let i = 0; i < 5; i++) {
-            const angle = (i / 5) * Math.PI * 2;
-            ctx.beginPath();
-            ctx.arc(x + Math.cos(angle) * size * 0.5, y + Math.sin(angle) * size * 0.5, size * 0.4, 0, Math.PI * 2);
-            ctx.fill();
+        const petalR = size * 0.4;
+        ctx.beginPath();
+        for (const [dx, dy] of JigsawActivity.PETAL_DIRS) {
+            const px = x + dx * size * 0.5;
+            const py = y + dy * size * 0.5;
+            ctx.moveTo(px + petalR, py);
+            ctx.arc(px, py, petalR, 0, Math.PI * 2);
         }
+        ctx.fill();
         // Center
         ctx.fillStyle = '#FFEB3B';
         ctx.beginPath();
@@ -935,11 +1073,11 @@ class JigsawActivity {
     }
 
     drawStar5(ctx, x, y, r) {
+        const points = JigsawActivity.STAR5_POINTS;
         ctx.beginPath();
-        for (let i = 0; i < 5; i++) {
-            const angle = (i * 4 * Math.PI) / 5 - Math.PI / 2;
-            const method = i === 0 ? 'moveTo' : 'lineTo';
-            ctx[method](x + Math.cos(angle) * r, y + Math.sin(angle) * r);
+        ctx.moveTo(x + points[0][0] * r, y + points[0][1] * r);
+        for (let i = 1; i < points.length; i++) {
+            ctx.lineTo(x + points[i][0] * r, y + points[i][1] * r);
         }
         ctx.closePath();
         ctx.fill();
@@ -947,6 +1085,10 @@ class JigsawActivity {
 
     stop() {
         console.log('Stopping Jigsaw Puzzle activity');
+        if (this._prewarmHandle !== null) {
+            (window.cancelIdleCallback || clearTimeout)(this._prewarmHandle);
+            this._prewarmHandle = null;
+        }
         if (this.boardCanvas) {
             this.boardCanvas.onclick = null;
         }
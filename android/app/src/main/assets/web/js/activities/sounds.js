@@ -25,6 +25,8 @@ class SoundsActivity {
 
         this.currentIndex = 0;
         this.correctWord = null;
+        this.options = [];
+        this.keyPressHandler = null;
         this.processing = false;
         this.rewards = null;
         this.roundCount = 0;
@@ -36,7 +38,7 @@ class SoundsActivity {
 
         // Set up rewards
         if (typeof RewardsManager !== 'undefined') {
-            this.rewards = new RewardsManager();
+            this.rewards = window.rewardsManager || new RewardsManager();
             await this.rewards.loadProgress();
             this.rewards.renderProgressPanel('soundsProgressDisplay', 'sounds');
         }
@@ -128,6 +130,8 @@ class SoundsActivity {
     handleKeyPress(e) {
         if (e.key === ' ' || e.key === 'Enter') {
             e.preventDefault();
+            // Holding the key would otherwise queue the sound over and over
+            if (e.repeat) return;
             this.speakSound();
         }
     }
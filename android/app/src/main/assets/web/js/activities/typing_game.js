@@ -20,6 +20,10 @@ class TypingGameActivity {
         this.isActive = false;
         this.keydownHandler = null;
         this.processing = false;
+        this._progressStarsEl = null;
+        this._progressLevelEl = null;
+        this._targetKeyEl = null;
+        this._streakCountEl = null;
     }
 
     async start() {
@@ -99,7 +103,8 @@ class TypingGameActivity {
     }
 
     handleKeyPress(event) {
-        if (!this.isActive || this.processing) return;
+        // Auto-repeat from a held key would re-run matching, speech and flashes
+        if (!this.isActive || this.processing || event.repeat) return;
 
         let key = event.key;
         if (key.length === 1) {
@@ -274,30 +279,28 @@ class TypingGameActivity {
     }
 
     highlightTargetKey() {
-        // Remove all existing highlights
-        document.querySelectorAll('.osk-key.target-key').forEach(k => k.classList.remove('target-key'));
-
-        if (this.currentType === 'word') {
-            const ch = this.currentTarget[this.currentWordIndex];
-            if (ch) {
-                const key = document.querySelector(`.osk-key[data-key="${ch}"]`);
-                if (key) key.classList.add('target-key');
-            }
-        } else {
-            const key = document.querySelector(`.osk-key[data-key="${this.currentTarget}"]`);
-            if (key) key.classList.add('target-key');
-        }
+        const ch = this.currentType === 'word' ? this.currentTarget[this.currentWordIndex] : this.currentTarget;
+        const key = ch ? document.querySelector(`.osk-key[data-key="${ch}"]`) : null;
+
+        // Only the previously highlighted key and the new one need updating
+        if (key === this._targetKeyEl) return;
+        if (this._targetKeyEl) this._targetKeyEl.classList.remove('target-key');
+        if (key) key.classList.add('target-key');
+        this._targetKeyEl = key;
     }
 
     highlightCurrentLetterInWord() {
-        document.querySelectorAll('.word-letter').forEach((el, i) => {
-            el.classList.remove('current-letter');
-            if (i < this.currentWordIndex) {
-                el.classList.add('completed-letter');
-            } else if (i === this.currentWordIndex) {
-                el.classList.add('current-letter');
+        // Only the letter just typed and the next one change
+        const targetEl = document.getElementById('typingTargetDisplay');
+        if (targetEl) {
+            const typed = targetEl.children[this.currentWordIndex - 1];
+            if (typed) {
+                typed.classList.remove('current-letter');
+                typed.classList.add('completed-letter');
             }
-        });
+            const next = targetEl.children[this.currentWordIndex];
+            if (next) next.classList.add('current-letter');
+        }
 
         // Update highlighted key on OSK
         this.highlightTargetKey();
@@ -334,30 +337,44 @@ class TypingGameActivity {
 
     updateProgressDisplay() {
         const el = document.getElementById('typingProgressDisplay');
-        if (el) {
+        if (!el) return;
+
+        // Build the panel once; each star afterwards only updates the two labels
+        if (!this._progressStarsEl || !el.contains(this._progressStarsEl)) {
             el.innerHTML = `
                 <div class="progress-info">
                     <div class="stars-display">
                         <i class="bi bi-star-fill text-warning"></i>
-                        <span class="ms-2 fw-bold">${this.activityStars}</span>
+                        <span class="ms-2 fw-bold"></span>
                     </div>
                     <div class="level-display">
                         <i class="bi bi-trophy-fill text-success"></i>
-                        <span class="ms-2 fw-bold">Level ${this.currentLevel}</span>
+                        <span class="ms-2 fw-bold"></span>
                     </div>
                 </div>
             `;
+            this._progressStarsEl = el.querySelector('.stars-display span');
+            this._progressLevelEl = el.querySelector('.level-display span');
         }
+
+        this._progressStarsEl.textContent = this.activityStars;
+        this._progressLevelEl.textContent = `Level ${this.currentLevel}`;
     }
 
     updateStreakDisplay() {
         const el = document.getElementById('streakDisplay');
         if (el) {
             if (this.streak > 0) {
-                el.innerHTML = `<i class="bi bi-fire"></i> ${this.streak}`;
+                // Build the icon once; later streaks only change the count
+                if (!this._streakCountEl || !el.contains(this._streakCountEl)) {
+                    el.innerHTML = '<i class="bi bi-fire"></i> <span></span>';
+                    this._streakCountEl = el.querySelector('span');
+                }
+                this._streakCountEl.textContent = this.streak;
+                el.style.visibility = '';
                 el.classList.add('streak-active');
             } else {
-                el.innerHTML = '';
+                el.style.visibility = 'hidden';
                 el.classList.remove('streak-active');
             }
         }
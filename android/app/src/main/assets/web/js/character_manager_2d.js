@@ -5,6 +5,16 @@
  */
 
 class CharacterManager2D {
+    /** Return-to-idle delay (ms) for one-shot animations */
+    static ANIMATION_DURATIONS = {
+        'wave': 1500,
+        'happy': 1200,
+        'point': 1500,
+        'thinking': 2000,
+        'clap': 1000,
+        'dance': 2500
+    };
+
     constructor(containerElement) {
         this.container = containerElement;
         this.characterElement = null;
@@ -108,39 +118,17 @@ class CharacterManager2D {
             clearTimeout(this.animationTimeout);
         }
 
-        // Remove all state classes
-        this.characterElement.classList.remove(
-            'state-idle',
-            'state-wave',
-            'state-talk',
-            'state-happy',
-            'state-point',
-            'state-thinking',
-            'state-clap',
-            'state-dance'
-        );
-
-        // Add new state class
-        const stateClass = `state-${animationName}`;
-        this.characterElement.classList.add(stateClass);
+        // Swap the previous state class for the new one
+        if (this.state !== animationName) {
+            this.characterElement.classList.remove(`state-${this.state}`);
+            this.characterElement.classList.add(`state-${animationName}`);
+        }
         this.currentAnimation = animationName;
         this.state = animationName;
 
         // For non-looping animations, return to idle after duration
-        const nonLoopingAnimations = ['wave', 'happy', 'point', 'thinking', 'clap', 'dance'];
-        if (nonLoopingAnimations.includes(animationName)) {
-            // Duration based on animation type
-            const durations = {
-                'wave': 1500,
-                'happy': 1200,
-                'point': 1500,
-                'thinking': 2000,
-                'clap': 1000,
-                'dance': 2500
-            };
-
-            const duration = durations[animationName] || 1500;
-
+        const duration = CharacterManager2D.ANIMATION_DURATIONS[animationName];
+        if (duration) {
             this.animationTimeout = setTimeout(() => {
                 if (this.currentAnimation === animationName && !this.isSpeaking) {
                     this.playAnimation('idle');
@@ -431,6 +431,9 @@
     }
   };
 
+  // Matches {name} template variables; compiled once rather than per replacement
+  const TEMPLATE_VAR = /\{(\w+)\}/g;
+
   /**
    * Get a random phrase from a category/subcategory and fill in template variables.
    * @param {string} category - Top-level category (e.g. 'greeting', 'correct_first_try')
@@ -455,9 +458,9 @@
     let text = pool[Math.floor(Math.random() * pool.length)];
 
     if (replacements) {
-      for (const [key, value] of Object.entries(replacements)) {
-        text = text.replace(new RegExp(`\\{${key}\\}`, 'g'), value);
-      }
+      text = text.replace(TEMPLATE_VAR, (match, key) =>
+        Object.prototype.hasOwnProperty.call(replacements, key) ? replacements[key] : match
+      );
     }
 
     return text;
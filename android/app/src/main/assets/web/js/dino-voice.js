@@ -74,6 +74,33 @@
   const REVERB_DURATION = 0.3;       // Slightly bigger reverb for depth perception
   const MASTER_GAIN = 0.92;          // Compensate for bass boost to prevent clipping
 
+  // Decoded audio for recently spoken phrases (text → AudioBuffer), oldest first
+  const BUFFER_CACHE_MAX = 40;
+  const bufferCache = new Map();
+
+  /**
+   * LRU cache get — moves the phrase to the most recently used end
+   */
+  function getCachedBuffer(text) {
+    const buffer = bufferCache.get(text);
+    if (!buffer) return null;
+    bufferCache.delete(text);
+    bufferCache.set(text, buffer);
+    return buffer;
+  }
+
+  /**
+   * LRU cache set — evicts the oldest phrase when full
+   */
+  function cacheBuffer(text, buffer) {
+    if (bufferCache.has(text)) {
+      bufferCache.delete(text);
+    } else if (bufferCache.size >= BUFFER_CACHE_MAX) {
+      bufferCache.delete(bufferCache.keys().next().value);
+    }
+    bufferCache.set(text, buffer);
+  }
+
   /**
    * Generate a synthetic room impulse response (no external files needed).
    * Creates exponential-decay random noise in stereo.
@@ -83,11 +110,13 @@
     const length = Math.floor(sampleRate * duration);
     const impulse = ctx.createBuffer(2, length, sampleRate);
 
-    for (let channel = 0; channel < 2; channel++) {
-      const data = impulse.getChannelData(channel);
-      for (let i = 0; i < length; i++) {
-        data[i] = (Math.random() * 2 - 1) * Math.pow(1 - i / length, 2.5);
-      }
+    // Both channels share one decay curve; evaluate it once per sample
+    const left = impulse.getChannelData(0);
+    const right = impulse.getChannelData(1);
+    for (let i = 0; i < length; i++) {
+      const decay = Math.pow(1 - i / length, 2.5);
+      left[i] = (Math.random() * 2 - 1) * decay;
+      right[i] = (Math.random() * 2 - 1) * decay;
     }
     return impulse;
   }
@@ -202,15 +231,27 @@
       await audioCtx.resume();
     }
 
-    // Request audio from main process (speed 0.9 for slight dino drawl)
-    const result = await window.electronAPI.ttsSpeak({ text, speed: 0.9 });
+    // Phrases spoken recently are replayed from the cache without an IPC round trip
+    let audioBuffer = getCachedBuffer(text);
+    if (!audioBuffer) {
+      // Request audio from main process (speed 0.9 for slight dino drawl)
+      const result = await window.electronAPI.ttsSpeak({ text, speed: 0.9 });
 
-    // Check if this request was cancelled while we were generating
-    if (genId !== currentGenId) return;
+      // Check if this request was cancelled while we were generating
+      if (genId !== currentGenId) return;
 
-    if (!result || !result.available || !result.samples) {
-      speakWithWebSpeech(text);
-      return;
+      if (!result || !result.available || !result.samples) {
+        speakWithWebSpeech(text);
+        return;
+      }
+
+      // Convert ArrayBuffer to Float32Array
+      const samples = new Float32Array(result.samples);
+
+      // Create AudioBuffer from PCM data
+      audioBuffer = audioCtx.createBuffer(1, samples.length, result.sampleRate);
+      audioBuffer.getChannelData(0).set(samples);
+      cacheBuffer(text, audioBuffer);
     }
 
     // Stop any current playback
@@ -219,14 +260,6 @@
       currentSource = null;
     }
 
-    // Convert ArrayBuffer to Float32Array
-    const samples = new Float32Array(result.samples);
-    const sampleRate = result.sampleRate;
-
-    // Create AudioBuffer from PCM data
-    const audioBuffer = audioCtx.createBuffer(1, samples.length, sampleRate);
-    audioBuffer.getChannelData(0).set(samples);
-
     // Create source and connect through effects chain
     const source = audioCtx.createBufferSource();
     source.buffer = audioBuffer;
@@ -88,13 +88,16 @@ class ProgressManager {
   }
 
   _save() {
-    this.store.set('total_stars', this.totalStars);
-    this.store.set('current_level', this.currentLevel);
-    this.store.set('stars_by_activity', this.starsByActivity);
-    this.store.set('stickers_collected', this.stickersCollected);
-    this.store.set('dino_accessories_unlocked', this.accessoriesUnlocked);
-    this.store.set('dino_current_outfit', this.currentOutfit);
-    this.store.set('last_updated', new Date().toISOString());
+    // One set() call means one validation and one file write for the whole snapshot
+    this.store.set({
+      total_stars: this.totalStars,
+      current_level: this.currentLevel,
+      stars_by_activity: this.starsByActivity,
+      stickers_collected: this.stickersCollected,
+      dino_accessories_unlocked: this.accessoriesUnlocked,
+      dino_current_outfit: this.currentOutfit,
+      last_updated: new Date().toISOString()
+    });
   }
 
   awardStar(activity) {
@@ -75,7 +75,7 @@ class TtsEngine {
       this._worker.on('error', (err) => {
         console.error('[TtsEngine] Worker error:', err.message);
         // Reject all pending requests
-        for (const [id, pending] of this._pendingRequests) {
+        for (const pending of this._pendingRequests.values()) {
           pending.reject(err);
         }
         this._pendingRequests.clear();
@@ -146,11 +146,9 @@ class TtsEngine {
     const key = this._cacheKey(text, speed);
     const cached = this._cacheGet(key);
     if (cached) {
-      return {
-        samples: new Float32Array(cached.samples), // Copy so caller can transfer
-        sampleRate: cached.sampleRate,
-        duration: cached.duration,
-      };
+      // IPC structured-clones the samples, so the cached array is never
+      // detached and can be handed out without copying
+      return cached;
     }
 
     // Send to worker thread
@@ -158,12 +156,7 @@ class TtsEngine {
     return new Promise((resolve, reject) => {
       this._pendingRequests.set(id, {
         resolve: (result) => {
-          // Store in cache (keep a copy since samples.buffer gets transferred)
-          this._cacheSet(key, {
-            samples: new Float32Array(result.samples),
-            sampleRate: result.sampleRate,
-            duration: result.duration,
-          });
+          this._cacheSet(key, result);
           resolve(result);
         },
         reject,
@@ -21,6 +21,9 @@ class ColorsShapesActivity {
             { name: 'Purple', hex: '#9400D3' }
         ];
 
+        // Every colour/shape pairing, built once; rounds pick from this pool
+        this.combinations = this.shapes.flatMap(shape => this.colors.map(color => ({ shape, color })));
+
         this.targetIndex = null;
         this.options = [];
         this.isWaiting = false;
@@ -32,7 +35,7 @@ class ColorsShapesActivity {
 
         // Set up rewards
         if (typeof RewardsManager !== 'undefined') {
-            this.rewards = new RewardsManager();
+            this.rewards = window.rewardsManager || new RewardsManager();
             await this.rewards.loadProgress();
             this.rewards.renderProgressPanel('csProgressDisplay', 'colors_shapes');
         }
@@ -55,22 +58,14 @@ class ColorsShapesActivity {
     }
 
     generateOptions() {
-        const options = [];
-        const used = new Set();
-
-        while (options.length < 6) {
-            const shape = this.shapes[Math.floor(Math.random() * this.shapes.length)];
-            const color = this.colors[Math.floor(Math.random() * this.colors.length)];
-            const key = `${color.name}-${shape.name}`;
-
-            // Ensure unique combinations
-            if (!used.has(key)) {
-                used.add(key);
-                options.push({ shape, color });
-            }
+        // Partial Fisher-Yates: six unique combinations, no retries
+        const pool = this.combinations.slice();
+        for (let i = 0; i < 6; i++) {
+            const j = i + Math.floor(Math.random() * (pool.length - i));
+            [pool[i], pool[j]] = [pool[j], pool[i]];
         }
 
-        return options;
+        return pool.slice(0, 6);
     }
 
     renderOptions() {
@@ -82,6 +77,8 @@ class ColorsShapesActivity {
 
         container.innerHTML = '';
 
+        // Build every option off-document, then insert them in one go
+        const fragment = document.createDocumentFragment();
         this.options.forEach((option, index) => {
             const optionDiv = document.createElement('div');
             optionDiv.className = 'shape-option';
@@ -113,8 +110,9 @@ class ColorsShapesActivity {
             // Add click handler
             optionDiv.addEventListener('click', () => this.handleClick(index));
 
-            container.appendChild(optionDiv);
+            fragment.appendChild(optionDiv);
         });
+        container.appendChild(fragment);
     }
 
     async speakInstruction() {
@@ -11,9 +11,15 @@ class DrawingActivity {
         this.currentBrushSize = 15; // Medium by default
         this.lastX = 0;
         this.lastY = 0;
+        this._canvasRect = null; // Cached for the duration of a stroke
+        this._pendingPoints = []; // Pointer samples waiting for the next frame
+        this._strokeFrame = null;
         this._resizeHandler = () => this.resizeCanvas();
         this._lastEncouragementTime = 0;
         this._encouragementInterval = null;
+        this._recentlyDrawn = false;
+        this.palettePage = 0;
+        this.totalPalettePages = 0;
     }
 
     async start() {
@@ -26,7 +32,11 @@ class DrawingActivity {
             return;
         }
 
-        this.ctx = this.canvas.getContext('2d');
+        // The page is always painted white, so an opaque context lets the
+        // browser skip alpha blending when compositing the canvas
+        this.ctx = this.canvas.getContext('2d', { alpha: false });
+        this.ctx.fillStyle = 'white';
+        this.ctx.fillRect(0, 0, this.canvas.width, this.canvas.height);
 
         // Set canvas size to be responsive
         this.resizeCanvas();
@@ -70,6 +80,10 @@ class DrawingActivity {
         this.canvas.width = maxWidth;
         this.canvas.height = maxHeight;
 
+        // Opaque canvases reset to black, so paint the new area white first
+        this.ctx.fillStyle = 'white';
+        this.ctx.fillRect(0, 0, this.canvas.width, this.canvas.height);
+
         // Restore canvas content if it existed
         if (imageData) {
             this.ctx.putImageData(imageData, 0, 0);
@@ -97,18 +111,12 @@ class DrawingActivity {
         const palette = document.getElementById('colorPalette');
         if (!palette) return;
 
-        const start = this.palettePage * ActivityManager.PALETTE_PAGE_SIZE;
-        const colors = ActivityManager.PALETTE_COLORS.slice(start, start + ActivityManager.PALETTE_PAGE_SIZE);
-
-        palette.innerHTML = colors.map(c => {
-            const border = c.border ? ' border-color: #dee2e6;' : '';
-            const active = c.hex === this.currentColor ? ' active' : '';
-            return `<div class="color-btn${active}" data-color="${c.hex}" style="background: ${c.hex};${border}" title="${c.name}"></div>`;
-        }).join('');
+        palette.innerHTML = ActivityManager.getPalettePageHTML(this.palettePage);
+        palette.querySelector(`.color-btn[data-color="${this.currentColor}"]`)?.classList.add('active');
 
         palette.querySelectorAll('.color-btn').forEach(btn => {
             btn.addEventListener('click', () => {
-                document.querySelectorAll('.color-btn').forEach(b => b.classList.remove('active'));
+                palette.querySelector('.color-btn.active')?.classList.remove('active');
                 btn.classList.add('active');
                 this.currentColor = btn.dataset.color;
             });
@@ -184,68 +192,83 @@ class DrawingActivity {
         this.canvas.addEventListener('mouseup', () => this.stopDrawing());
         this.canvas.addEventListener('mouseout', () => this.stopDrawing());
 
-        // Touch events for mobile
+        // Touch events for mobile — a Touch carries clientX/clientY, so pass it
+        // straight through rather than allocating a synthetic MouseEvent per move
         this.canvas.addEventListener('touchstart', (e) => {
             e.preventDefault();
-            const touch = e.touches[0];
-            const mouseEvent = new MouseEvent('mousedown', {
-                clientX: touch.clientX,
-                clientY: touch.clientY
-            });
-            this.canvas.dispatchEvent(mouseEvent);
+            this.startDrawing(e.touches[0]);
         });
 
         this.canvas.addEventListener('touchmove', (e) => {
             e.preventDefault();
-            const touch = e.touches[0];
-            const mouseEvent = new MouseEvent('mousemove', {
-                clientX: touch.clientX,
-                clientY: touch.clientY
-            });
-            this.canvas.dispatchEvent(mouseEvent);
+            this.draw(e.touches[0]);
         });
 
         this.canvas.addEventListener('touchend', (e) => {
             e.preventDefault();
-            const mouseEvent = new MouseEvent('mouseup', {});
-            this.canvas.dispatchEvent(mouseEvent);
+            this.stopDrawing();
         });
     }
 
     startDrawing(e) {
         this.isDrawing = true;
-        const rect = this.canvas.getBoundingClientRect();
-        this.lastX = e.clientX - rect.left;
-        this.lastY = e.clientY - rect.top;
+        // Measure once per stroke; getBoundingClientRect() forces layout
+        this._canvasRect = this.canvas.getBoundingClientRect();
+        this.lastX = e.clientX - this._canvasRect.left;
+        this.lastY = e.clientY - this._canvasRect.top;
+
+        // Colour and size can't change mid-stroke, so apply them once here
+        this.ctx.strokeStyle = this.currentColor;
+        this.ctx.lineWidth = this.currentBrushSize;
+        this.ctx.lineCap = 'round';
+        this.ctx.lineJoin = 'round';
     }
 
     draw(e) {
         if (!this.isDrawing) return;
 
-        const rect = this.canvas.getBoundingClientRect();
-        const currentX = e.clientX - rect.left;
-        const currentY = e.clientY - rect.top;
+        const rect = this._canvasRect;
+        this._pendingPoints.push(e.clientX - rect.left, e.clientY - rect.top);
+        if (this._strokeFrame === null) {
+            this._strokeFrame = requestAnimationFrame(() => this.flushStroke());
+        }
+        this._recentlyDrawn = true;
+    }
+
+    /**
+     * Draws every pointer sample gathered since the last frame as one path.
+     */
+    flushStroke() {
+        if (this._strokeFrame !== null) {
+            cancelAnimationFrame(this._strokeFrame);
+            this._strokeFrame = null;
+        }
+        const points = this._pendingPoints;
+        if (points.length === 0) return;
 
         this.ctx.beginPath();
         this.ctx.moveTo(this.lastX, this.lastY);
-        this.ctx.lineTo(currentX, currentY);
-        this.ctx.strokeStyle = this.currentColor;
-        this.ctx.lineWidth = this.currentBrushSize;
-        this.ctx.lineCap = 'round';
-        this.ctx.lineJoin = 'round';
+        for (let i = 0; i < points.length; i += 2) {
+            this.ctx.lineTo(points[i], points[i + 1]);
+        }
         this.ctx.stroke();
 
-        this.lastX = currentX;
-        this.lastY = currentY;
-        this._recentlyDrawn = true;
+        this.lastX = points[points.length - 2];
+        this.lastY = points[points.length - 1];
+        points.length = 0;
     }
 
     stopDrawing() {
+        this.flushStroke();
         this.isDrawing = false;
     }
 
     stop() {
         console.log('Stopping Drawing activity');
+        if (this._strokeFrame !== null) {
+            cancelAnimationFrame(this._strokeFrame);
+            this._strokeFrame = null;
+        }
         if (this._encouragementInterval) {
             clearInterval(this._encouragementInterval);
             this._encouragementInterval = null;
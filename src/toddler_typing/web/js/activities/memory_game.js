@@ -33,13 +33,14 @@ class MemoryGameActivity {
 
         // Set up rewards
         if (typeof RewardsManager !== 'undefined') {
-            this.rewards = new RewardsManager();
+            this.rewards = window.rewardsManager || new RewardsManager();
             await this.rewards.loadProgress();
             this.rewards.renderProgressPanel('memoryProgressDisplay', 'memory_game');
         }
 
-        // Set up difficulty buttons
+        // Set up difficulty buttons and card clicks
         this.setupDifficultyButtons();
+        this.setupGridEvents();
 
         // Character wave
         if (window.characterManager) {
@@ -64,6 +65,17 @@ class MemoryGameActivity {
         });
     }
 
+    setupGridEvents() {
+        const grid = document.getElementById('memoryGrid');
+        if (!grid) return;
+
+        // One delegated listener serves every card, across all rounds
+        grid.addEventListener('click', (e) => {
+            const cardEl = e.target.closest('.memory-card');
+            if (cardEl) this.handleCardClick(cardEl);
+        });
+    }
+
     startNewGame() {
         const config = this.difficulties[this.difficulty];
         this.totalPairs = config.pairs;
@@ -109,10 +121,6 @@ class MemoryGameActivity {
                 </div>
             </div>
         `).join('');
-
-        grid.querySelectorAll('.memory-card').forEach(cardEl => {
-            cardEl.addEventListener('click', () => this.handleCardClick(cardEl));
-        });
     }
 
     async handleCardClick(cardEl) {
@@ -205,6 +205,8 @@ class FullscreenManager {
                                document.mozFullScreenElement ||
                                document.msFullscreenElement);
 
+        // Prefixed and unprefixed events both fire for one transition
+        if (isFullscreen === AppState.isFullscreen) return;
         AppState.isFullscreen = isFullscreen;
 
         // Update icon
@@ -455,10 +457,38 @@ class ActivityManager {
         this.currentActivityInstance = null;
         this._idleTimer = null;
         this._idleTimeout = 20000; // 20 seconds
+        this._lastInteraction = 0;
         this._idleResetHandler = null;
         this._currentActivityName = null;
+
+        // Activity name → class, resolved once (each class lives in its own script)
+        this._activityClasses = {
+            drawing: typeof DrawingActivity !== 'undefined' ? DrawingActivity : null,
+            colors_shapes: typeof ColorsShapesActivity !== 'undefined' ? ColorsShapesActivity : null,
+            dot2dot: typeof Dot2DotActivity !== 'undefined' ? Dot2DotActivity : null,
+            sounds: typeof SoundsActivity !== 'undefined' ? SoundsActivity : null,
+            coloring: typeof ColoringActivity !== 'undefined' ? ColoringActivity : null,
+            typing_game: typeof TypingGameActivity !== 'undefined' ? TypingGameActivity : null,
+            memory_game: typeof MemoryGameActivity !== 'undefined' ? MemoryGameActivity : null,
+            jigsaw: typeof JigsawActivity !== 'undefined' ? JigsawActivity : null,
+            sorting: typeof SortingActivity !== 'undefined' ? SortingActivity : null
+        };
     }
 
+    // Activity name → method that builds its screen markup
+    static ACTIVITY_CONTENT = {
+        drawing: 'getDrawingContent',
+        colors_shapes: 'getColorsShapesContent',
+        dot2dot: 'getDot2DotContent',
+        sounds: 'getSoundsContent',
+        coloring: 'getColoringContent',
+        typing_game: 'getTypingGameContent',
+        memory_game: 'getMemoryGameContent',
+        jigsaw: 'getJigsawContent',
+        sorting: 'getSortingContent',
+        trophy_room: 'getTrophyRoomContent'
+    };
+
     /**
      * Returns the shared color palette HTML used by drawing, dot2dot, and coloring activities
      */
@@ -491,7 +521,38 @@ class ActivityManager {
 
     static PALETTE_PAGE_SIZE = 12;
 
+    // Colour button markup per palette page, built on first use
+    static _palettePageHTML = new Map();
+
+    /**
+     * Returns the colour buttons for one palette page. The markup depends only
+     * on the page index, so each page is built once and reused on every flip.
+     */
+    static getPalettePageHTML(page) {
+        let html = ActivityManager._palettePageHTML.get(page);
+        if (html === undefined) {
+            const start = page * ActivityManager.PALETTE_PAGE_SIZE;
+            const colors = ActivityManager.PALETTE_COLORS.slice(start, start + ActivityManager.PALETTE_PAGE_SIZE);
+            html = colors.map(c => {
+                const border = c.border ? ' border-color: #dee2e6;' : '';
+                return `<div class="color-btn" data-color="${c.hex}" style="background: ${c.hex};${border}" title="${c.name}"></div>`;
+            }).join('');
+            ActivityManager._palettePageHTML.set(page, html);
+        }
+        return html;
+    }
+
+    // Shared colour/brush controls markup, built on first use
+    static _canvasControlsHTML = null;
+
     static getCanvasControlsHTML() {
+        if (ActivityManager._canvasControlsHTML === null) {
+            ActivityManager._canvasControlsHTML = ActivityManager.buildCanvasControlsHTML();
+        }
+        return ActivityManager._canvasControlsHTML;
+    }
+
+    static buildCanvasControlsHTML() {
         const colors = ActivityManager.PALETTE_COLORS.slice(0, ActivityManager.PALETTE_PAGE_SIZE);
         const colorsHTML = colors.map((c, i) => {
             const border = c.border ? ' border-color: #dee2e6;' : '';
@@ -607,12 +668,21 @@ class ActivityManager {
     }
 
     _resetIdleTimer() {
-        if (this._idleTimer) clearTimeout(this._idleTimer);
+        // Just stamp the time; a pending timer re-checks it when it fires
+        this._lastInteraction = performance.now();
+        if (!this._idleTimer) this._armIdleTimer(this._idleTimeout);
+    }
+
+    _armIdleTimer(delay) {
         this._idleTimer = setTimeout(() => {
-            if (this._currentActivityName && window.DinoVoice && !AppState.isMuted) {
+            this._idleTimer = null;
+            const remaining = this._idleTimeout - (performance.now() - this._lastInteraction);
+            if (remaining > 0) {
+                this._armIdleTimer(remaining);
+            } else if (this._currentActivityName && window.DinoVoice && !AppState.isMuted) {
                 window.DinoVoice.speakPhrase('idle_nudge');
             }
-        }, this._idleTimeout);
+        }, delay);
     }
 
     _stopIdleNudge() {
@@ -628,110 +698,24 @@ class ActivityManager {
     }
 
     async startActivityLogic(activityName) {
-        switch (activityName) {
-            case 'drawing':
-                if (typeof DrawingActivity !== 'undefined') {
-                    this.currentActivityInstance = new DrawingActivity();
-                    await this.currentActivityInstance.start();
-                }
-                break;
-            case 'colors_shapes':
-                if (typeof ColorsShapesActivity !== 'undefined') {
-                    this.currentActivityInstance = new ColorsShapesActivity();
-                    await this.currentActivityInstance.start();
-                }
-                break;
-            case 'dot2dot':
-                if (typeof Dot2DotActivity !== 'undefined') {
-                    this.currentActivityInstance = new Dot2DotActivity();
-                    await this.currentActivityInstance.start();
-                }
-                break;
-            case 'sounds':
-                if (typeof SoundsActivity !== 'undefined') {
-                    this.currentActivityInstance = new SoundsActivity();
-                    await this.currentActivityInstance.start();
-                }
-                break;
-            case 'coloring':
-                if (typeof ColoringActivity !== 'undefined') {
-                    this.currentActivityInstance = new ColoringActivity();
-                    await this.currentActivityInstance.start();
-                }
-                break;
-            case 'typing_game':
-                if (typeof TypingGameActivity !== 'undefined') {
-                    this.currentActivityInstance = new TypingGameActivity();
-                    await this.currentActivityInstance.start();
-                }
-                break;
-            case 'memory_game':
-                if (typeof MemoryGameActivity !== 'undefined') {
-                    this.currentActivityInstance = new MemoryGameActivity();
-                    await this.currentActivityInstance.start();
-                }
-                break;
-            case 'jigsaw':
-                if (typeof JigsawActivity !== 'undefined') {
-                    this.currentActivityInstance = new JigsawActivity();
-                    await this.currentActivityInstance.start();
-                }
-                break;
-            case 'sorting':
-                if (typeof SortingActivity !== 'undefined') {
-                    this.currentActivityInstance = new SortingActivity();
-                    await this.currentActivityInstance.start();
-                }
-                break;
-            case 'trophy_room':
-                // Trophy room is rendered by rewards manager after content loads
-                if (window.rewardsManager) {
-                    await window.rewardsManager.loadProgress();
-                    window.rewardsManager.renderTrophyRoom();
-                }
-                break;
-            default:
-                console.log('No logic implemented for this activity yet');
+        const ActivityClass = this._activityClasses[activityName];
+        if (ActivityClass) {
+            this.currentActivityInstance = new ActivityClass();
+            await this.currentActivityInstance.start();
+        } else if (activityName === 'trophy_room') {
+            // Trophy room is rendered by rewards manager after content loads
+            if (window.rewardsManager) {
+                await window.rewardsManager.loadProgress();
+                window.rewardsManager.renderTrophyRoom();
+            }
+        } else if (!(activityName in this._activityClasses)) {
+            console.log('No logic implemented for this activity yet');
         }
     }
 
     loadActivityContent(activityName) {
-        let content = '';
-
-        switch (activityName) {
-            case 'drawing':
-                content = this.getDrawingContent();
-                break;
-            case 'colors_shapes':
-                content = this.getColorsShapesContent();
-                break;
-            case 'dot2dot':
-                content = this.getDot2DotContent();
-                break;
-            case 'sounds':
-                content = this.getSoundsContent();
-                break;
-            case 'coloring':
-                content = this.getColoringContent();
-                break;
-            case 'typing_game':
-                content = this.getTypingGameContent();
-                break;
-            case 'memory_game':
-                content = this.getMemoryGameContent();
-                break;
-            case 'jigsaw':
-                content = this.getJigsawContent();
-                break;
-            case 'sorting':
-                content = this.getSortingContent();
-                break;
-            case 'trophy_room':
-                content = this.getTrophyRoomContent();
-                break;
-            default:
-                content = '<h2>Activity not found</h2>';
-        }
+        const builder = ActivityManager.ACTIVITY_CONTENT[activityName];
+        const content = builder ? this[builder]() : '<h2>Activity not found</h2>';
 
         this.navigation.setActivityContent(content);
     }
@@ -4,6 +4,9 @@
  */
 
 class CharacterManager {
+    /** Clips that repeat until replaced; everything else plays once */
+    static LOOPING_ANIMATIONS = new Set(['idle', 'talk', 'walk']);
+
     constructor(containerElement) {
         this.container = containerElement;
         this.scene = null;
@@ -16,6 +19,13 @@ class CharacterManager {
         this.clock = new THREE.Clock();
         this.isInitialized = false;
         this.animationFrame = null;
+        this._animate = () => this.animate(); // One frame callback, reused every frame
+        this.isOnScreen = true;
+        this.visibilityObserver = null;
+        this.positions = [];
+        this.currentPositionIndex = 0;
+        this.repositionInterval = null;
+        this._needsRender = true; // Set when the view changes outside the mixer
 
         // Animation state
         this.state = 'idle';
@@ -45,6 +55,7 @@ class CharacterManager {
             this.setupCamera();
             this.setupRenderer();
             this.setupLights();
+            this.setupVisibilityCulling();
 
             // Load the character model
             await this.loadModel();
@@ -241,6 +252,13 @@ class CharacterManager {
                     if (gltf.animations && gltf.animations.length > 0) {
                         this.mixer = new THREE.AnimationMixer(this.model);
 
+                        // One-shot animations return to idle when they finish
+                        this.mixer.addEventListener('finished', (e) => {
+                            if (e.action === this.currentAnimation) {
+                                this.playAnimation('idle');
+                            }
+                        });
+
                         // Store all animations by name
                         gltf.animations.forEach((clip) => {
                             this.animations[clip.name] = clip;
@@ -262,11 +280,24 @@ class CharacterManager {
         });
     }
 
+    /**
+     * Track whether the character is on screen so hidden frames skip rendering
+     */
+    setupVisibilityCulling() {
+        if (typeof IntersectionObserver === 'undefined') return;
+
+        this.visibilityObserver = new IntersectionObserver((entries) => {
+            this.isOnScreen = entries[entries.length - 1].isIntersecting;
+            if (this.isOnScreen) this._needsRender = true;
+        });
+        this.visibilityObserver.observe(this.container);
+    }
+
     /**
      * Main animation loop
      */
     animate() {
-        this.animationFrame = requestAnimationFrame(() => this.animate());
+        this.animationFrame = requestAnimationFrame(this._animate);
 
         const delta = this.clock.getDelta();
 
@@ -276,14 +307,20 @@ class CharacterManager {
         }
 
         // Optional: Add subtle idle movement when not playing animation
-        if (!this.currentAnimation && this.model) {
+        const swaying = !this.currentAnimation && this.model;
+        if (swaying) {
             const time = this.clock.getElapsedTime();
             this.model.rotation.y = Math.sin(time * 0.3) * 0.1; // Subtle sway
         }
 
-        // Render the scene
-        if (this.renderer && this.scene && this.camera) {
+        // A clip clamped on its last frame draws the same image every time
+        const changed = swaying || this._needsRender ||
+            (this.currentAnimation && this.currentAnimation.isRunning());
+
+        // Render the scene (culled while the container is hidden or off-screen)
+        if (changed && this.isOnScreen && this.renderer && this.scene && this.camera) {
             this.renderer.render(this.scene, this.camera);
+            this._needsRender = false;
         }
     }
 
@@ -311,19 +348,14 @@ class CharacterManager {
         if (loop !== null) {
             action.setLoop(loop ? THREE.LoopRepeat : THREE.LoopOnce);
         } else {
-            const loopingAnimations = ['idle', 'talk', 'walk'];
-            const shouldLoop = loopingAnimations.includes(animationName);
+            const shouldLoop = CharacterManager.LOOPING_ANIMATIONS.has(animationName);
             action.setLoop(shouldLoop ? THREE.LoopRepeat : THREE.LoopOnce);
         }
 
-        // If not looping, reset to idle when done
+        // If not looping, hold the last frame; the mixer's 'finished'
+        // listener then returns to idle
         if (action.loop === THREE.LoopOnce) {
             action.clampWhenFinished = true;
-            this.mixer.addEventListener('finished', (e) => {
-                if (e.action === action) {
-                    this.playAnimation('idle');
-                }
-            });
         }
 
         action.reset();
@@ -391,6 +423,7 @@ class CharacterManager {
         this.camera.updateProjectionMatrix();
 
         this.renderer.setSize(width, height);
+        this._needsRender = true;
     }
 
     /**
@@ -407,6 +440,10 @@ class CharacterManager {
             clearInterval(this.repositionInterval);
         }
 
+        if (this.visibilityObserver) {
+            this.visibilityObserver.disconnect();
+        }
+
         // Dispose Three.js resources
         if (this.renderer) {
             this.renderer.dispose();
@@ -97,6 +97,10 @@
 
   const STICKER_CATEGORIES = ['Animals', 'Nature', 'Space', 'Food', 'Dinos'];
 
+  // id -> registry entry, for click handlers
+  const STICKERS_BY_ID = new Map(STICKER_REGISTRY.map(s => [s.id, s]));
+  const ACCESSORIES_BY_ID = new Map(ACCESSORY_REGISTRY.map(a => [a.id, a]));
+
   class RewardsManager {
     constructor() {
       this.collectedStickers = [];
@@ -104,6 +108,8 @@
       this.currentOutfit = { hat: null, accessory: null };
       this.totalStars = 0;
       this.currentLevel = 1;
+      this._homeTitleKey = null; // stars/level last rendered into the menu title
+      this._starCountEl = null; // star counter inside the activity progress panel
     }
 
     async loadProgress() {
@@ -131,7 +137,8 @@
 
       if (stickerCount > currentStickerCount) {
         // Award next uncollected sticker
-        const availableStickers = STICKER_REGISTRY.filter(s => !this.collectedStickers.includes(s.id));
+        const collected = new Set(this.collectedStickers);
+        const availableStickers = STICKER_REGISTRY.filter(s => !collected.has(s.id));
         if (availableStickers.length > 0) {
           const sticker = availableStickers[Math.floor(Math.random() * availableStickers.length)];
           const result = await AppAPI.call('award_sticker', sticker.id);
@@ -147,7 +154,8 @@
       const currentAccessoryCount = this.unlockedAccessories.length;
 
       if (accessoryCount > currentAccessoryCount) {
-        const availableAccessories = ACCESSORY_REGISTRY.filter(a => !this.unlockedAccessories.includes(a.id));
+        const unlocked = new Set(this.unlockedAccessories);
+        const availableAccessories = ACCESSORY_REGISTRY.filter(a => !unlocked.has(a.id));
         if (availableAccessories.length > 0) {
           const accessory = availableAccessories[Math.floor(Math.random() * availableAccessories.length)];
           const result = await AppAPI.call('unlock_accessory', accessory.id);
@@ -203,6 +211,11 @@
 
       const levelName = this.getLevelName(this.currentLevel);
 
+      // Returning to the menu usually changes nothing; keep the existing markup
+      const key = `${this.totalStars}|${levelName}`;
+      if (key === this._homeTitleKey && titleEl.querySelector('.home-rewards-display')) return;
+      this._homeTitleKey = key;
+
       titleEl.innerHTML = `
         <div class="home-rewards-display">
           <div class="home-star-counter">
@@ -225,10 +238,11 @@
       mainMenu.classList.add('hidden');
       activityScreen.classList.add('active');
 
+      const collectedIds = new Set(this.collectedStickers);
       const categories = STICKER_CATEGORIES.map(cat => {
         const stickers = STICKER_REGISTRY.filter(s => s.category === cat);
         const stickerHTML = stickers.map(s => {
-          const collected = this.collectedStickers.includes(s.id);
+          const collected = collectedIds.has(s.id);
           return `
             <div class="album-sticker ${collected ? 'collected' : 'locked'}" data-sticker-id="${s.id}">
               <span class="album-sticker-emoji">${collected ? s.emoji : '?'}</span>
@@ -266,7 +280,7 @@
       activityContent.querySelectorAll('.album-sticker.collected').forEach(el => {
         el.addEventListener('click', () => {
           el.classList.add('sticker-bounce');
-          const sticker = STICKER_REGISTRY.find(s => s.id === el.dataset.stickerId);
+          const sticker = STICKERS_BY_ID.get(el.dataset.stickerId);
           if (sticker) {
             AppAPI.call('speak', sticker.name);
           }
@@ -304,8 +318,9 @@
       }).join('');
 
       // Sticker grid
+      const collectedIds = new Set(this.collectedStickers);
       const stickersHTML = STICKER_REGISTRY.map(s => {
-        const collected = this.collectedStickers.includes(s.id);
+        const collected = collectedIds.has(s.id);
         return `
           <div class="trophy-item ${collected ? 'collected' : 'locked'}" data-sticker-id="${s.id}">
             <span class="trophy-item-emoji">${collected ? s.emoji : '?'}</span>
@@ -315,8 +330,9 @@
       }).join('');
 
       // Accessory grid
+      const unlockedIds = new Set(this.unlockedAccessories);
       const accessoriesHTML = ACCESSORY_REGISTRY.map(a => {
-        const unlocked = this.unlockedAccessories.includes(a.id);
+        const unlocked = unlockedIds.has(a.id);
         return `
           <div class="trophy-item ${unlocked ? 'collected' : 'locked'}" data-accessory-id="${a.id}">
             <span class="trophy-item-emoji">${unlocked ? a.emoji : '?'}</span>
@@ -344,7 +360,7 @@
       // Click collected stickers to hear name
       container.querySelectorAll('.trophy-item.collected[data-sticker-id]').forEach(el => {
         el.addEventListener('click', () => {
-          const sticker = STICKER_REGISTRY.find(s => s.id === el.dataset.stickerId);
+          const sticker = STICKERS_BY_ID.get(el.dataset.stickerId);
           if (sticker) AppAPI.call('speak', sticker.name);
         });
       });
@@ -352,7 +368,7 @@
       // Click unlocked accessories to hear name
       container.querySelectorAll('.trophy-item.collected[data-accessory-id]').forEach(el => {
         el.addEventListener('click', () => {
-          const acc = ACCESSORY_REGISTRY.find(a => a.id === el.dataset.accessoryId);
+          const acc = ACCESSORIES_BY_ID.get(el.dataset.accessoryId);
           if (acc) AppAPI.call('speak', acc.name);
         });
       });
@@ -375,6 +391,7 @@
           </div>
         </div>
       `;
+      this._starCountEl = container.querySelector('#activityStarCount');
     }
 
     playStarAnimation(containerId) {
@@ -391,8 +408,10 @@
 
     updateStarCount(newTotal) {
       this.totalStars = newTotal;
-      const el = document.getElementById('activityStarCount');
-      if (el) el.textContent = newTotal;
+      if (!this._starCountEl || !this._starCountEl.isConnected) {
+        this._starCountEl = document.getElementById('activityStarCount');
+      }
+      if (this._starCountEl) this._starCountEl.textContent = newTotal;
     }
   }
 